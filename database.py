@@ -3,8 +3,11 @@ ClearQuote – Async SQLAlchemy engine + ORM models.
 Matches the 4 tables: vehicle_cards, damage_detections, repairs, quotes.
 """
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import declarative_base, sessionmaker
+import asyncio
+
+import asyncpg
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import declarative_base
 from sqlalchemy import (
     Column, Integer, String, Float, Boolean, DateTime, Text, Numeric
 )
@@ -40,9 +43,8 @@ def initialize_database():
     _ASYNC_URL = config.DB_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
     
     engine = create_async_engine(_ASYNC_URL, echo=False, pool_pre_ping=True)
-    async_session_factory = sessionmaker(
+    async_session_factory = async_sessionmaker(
         engine, 
-        class_=AsyncSession, 
         expire_on_commit=False
     )
 
@@ -65,6 +67,67 @@ def get_engine():
     return engine
 
 
+def get_autocommit_engine():
+    """
+    Get an AUTOCOMMIT view of the engine for one-off read-only statements.
+    Shares the same pool but skips the implicit BEGIN/COMMIT round-trip.
+    """
+    return get_engine().execution_options(isolation_level="AUTOCOMMIT")
+
+
+# ---------------------------------------------------------------------------
+# Raw asyncpg pool (read-only hot path, no ORM session)
+# ---------------------------------------------------------------------------
+pool = None
+_pool_lock = asyncio.Lock()
+
+
+async def get_pool():
+    """
+    Get the shared asyncpg pool, creating it on first use.
+    """
+    global pool
+
+    if pool is None:
+        async with _pool_lock:
+            if pool is None:
+                if not config.DB_URL:
+                    raise RuntimeError(
+                        "DB_URL is not configured. "
+                        "Please set it via POST /api/config/db-url endpoint."
+                    )
+                pool = await asyncpg.create_pool(
+                    dsn=config.DB_URL, min_size=5, max_size=20
+                )
+    return pool
+
+
+async def execute_select(sql: str) -> tuple[list[str], list]:
+    """
+    Run a validated SELECT on a pooled connection.
+    Returns (column_names, asyncpg Records); column names are known even
+    when no rows match. Skips the SQLAlchemy session / unit-of-work
+    machinery entirely.
+    """
+    current_pool = await get_pool()
+    async with current_pool.acquire() as conn:
+        stmt = await conn.prepare(sql)
+        records = await stmt.fetch()
+        columns = [attr.name for attr in stmt.get_attributes()]
+    return columns, records
+
+
+async def close_pool():
+    """
+    Close the asyncpg pool if it was created.
+    """
+    global pool
+
+    if pool is not None:
+        await pool.close()
+        pool = None
+
+
 # ---------------------------------------------------------------------------
 # Connectivity check
 # ---------------------------------------------------------------------------
@@ -72,7 +135,7 @@ async def test_connection():
     """
     Test database connectivity.
     """
-    current_engine = get_engine()
+    current_engine = get_autocommit_engine()
     async with current_engine.connect() as conn:
         from sqlalchemy import text
         await conn.execute(text("SELECT 1"))
@@ -3,32 +3,86 @@ ClearQuote – Gemini API client.
 
 Two responsibilities:
   1. nl_to_sql(question)  → raw SQL string
-  2. format_answer(question, sql, rows) → human-readable answer string
+  2. format_answer(question, sql, columns, rows) → human-readable answer string
 
 Both use gemini-2.5-flash via the official google-genai SDK.
 """
 
-import json
-import google.generativeai as genai
+from typing import Any
+
+import orjson
+
 from config import config
 from schema_context import SCHEMA_CONTEXT
 
 # ---------------------------------------------------------------------------
 # Model will be configured dynamically when needed
 # ---------------------------------------------------------------------------
-def _get_model():
+# The SDK pulls in grpc/protobuf, so it is imported on first use only.
+_genai = None
+
+# Built models keyed on (api_key, model_name); a config change simply
+# produces a new key, so stale entries are never handed out.
+_MODEL_CACHE: dict[tuple[str, str], Any] = {}
+
+# Key the SDK's global client is currently configured with. Each cached model
+# keeps the client it opens on first use, so configure() – which throws
+# the default clients away – only runs when the key actually changes.
+_configured_api_key: str | None = None
+
+
+def get_genai():
+    """
+    Import google.generativeai on first call and return the module.
+    """
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai
+        _genai = genai
+    return _genai
+
+
+def _get_model(snapshot: dict | None = None):
     """
     Get a Gemini model instance with current configuration.
     This ensures we always use the latest API key and model settings.
+    Pass a config *snapshot* to avoid re-reading the config store.
     """
-    if not config.GEMINI_API_KEY:
+    if snapshot is None:
+        snapshot = config._snapshot()
+    api_key = config._gemini_api_key(snapshot)
+    model_name = config._gemini_model(snapshot)
+
+    if not api_key:
         raise RuntimeError(
             "Gemini API key is not configured. "
             "Please set it via POST /api/config/api-key endpoint."
         )
-    
-    genai.configure(api_key=config.GEMINI_API_KEY)
-    return genai.GenerativeModel(config.GEMINI_MODEL)
+
+    global _configured_api_key
+
+    cache_key = (api_key, model_name)
+    model = _MODEL_CACHE.get(cache_key)
+    if model is None:
+        genai = get_genai()
+        if _configured_api_key != api_key:
+            genai.configure(api_key=api_key)
+            _configured_api_key = api_key
+        model = genai.GenerativeModel(model_name)
+        _MODEL_CACHE[cache_key] = model
+    return model
+
+
+def invalidate_model_cache() -> None:
+    """
+    Drop every cached model so the next call re-configures the SDK.
+    Call this after the API key changes or after anything else has called
+    genai.configure().
+    """
+    global _configured_api_key
+    _MODEL_CACHE.clear()
+    _configured_api_key = None
+
 
 # ---------------------------------------------------------------------------
 # Prompt templates (kept as module-level constants for easy tweaking)
@@ -81,7 +135,9 @@ The user asked the following question about vehicle data:
 
 "{question}"
 
-A SQL query was run and returned the following results (as JSON):
+A SQL query was run and returned the following results (as JSON – column
+names are listed once in "columns", and each entry in "rows" is one result
+row with values in the same order):
 
 {results_json}
 
@@ -112,20 +168,53 @@ RULES FOR FORMATTING THE ANSWER
    c) If the COUNT is > 0 and the aggregate has a real value, give the
       value normally and mention how many records contributed to it:
       "The average repair cost … is ₹ XXX.XX (based on N repairs)."
-   d) If no COUNT column is present and the result set is an empty list
-      ([]), say: "No matching records were found."
+   d) If no COUNT column is present and "rows" is an empty list ([]),
+      say: "No matching records were found."
 9. Never say "no data available" without explaining WHY – use the
    distinctions in rule 8 above.
 """
 
+# The schema never changes, so resolve it once and split each template around
+# its per-request holes; callers only concatenate the dynamic parts.
+# Segments stay as str: generate_content_async() only accepts text, so a
+# bytes prefix would just add an encode/decode round-trip per request.
+_NL_PREFIX, _NL_SUFFIX = (
+    _NL_TO_SQL_PROMPT.replace("{schema}", SCHEMA_CONTEXT).split("{question}")
+)
+
+_FMT_HEAD, _fmt_rest = _FORMAT_ANSWER_PROMPT.split("{question}")
+_FMT_AFTER_QUESTION, _fmt_rest = _fmt_rest.split("{results_json}")
+_FMT_AFTER_RESULTS, _FMT_TAIL = _fmt_rest.split("{sql}")
+del _fmt_rest
+
+
+def _dumps(value) -> str:
+    return orjson.dumps(value, default=str).decode()
+
+
+def _dump_rows(columns: list[str], rows: list[tuple]) -> str:
+    """
+    Serialise DB rows for the answer prompt in columnar form: the header is
+    written once and each row is a compact array on its own line.
+    Decimals and other non-native values fall back to str().
+    """
+    if not rows:
+        return '{\n  "columns": ' + _dumps(columns) + ',\n  "rows": []\n}'
+    body = ",\n    ".join([_dumps(row) for row in rows])
+    return (
+        '{\n  "columns": ' + _dumps(columns)
+        + ',\n  "rows": [\n    ' + body + '\n  ]\n}'
+    )
+
 
 # ---------------------------------------------------------------------------
 # Public helpers
 # ---------------------------------------------------------------------------
 
-async def nl_to_sql(question: str) -> str:
+async def nl_to_sql(question: str, snapshot: dict | None = None) -> str:
     """
     Send *question* to Gemini and get back a raw SQL string.
+    *snapshot* is an optional pre-loaded config dict (see config._snapshot()).
 
     Returns
     -------
@@ -135,10 +224,10 @@ async def nl_to_sql(question: str) -> str:
     ------
     RuntimeError – if the API call fails.
     """
-    prompt = _NL_TO_SQL_PROMPT.format(schema=SCHEMA_CONTEXT, question=question)
+    prompt = _NL_PREFIX + question + _NL_SUFFIX
 
     try:
-        model = _get_model()  # Get model with current config
+        model = _get_model(snapshot)  # Get model with current config
         response = await model.generate_content_async(prompt)
         sql_raw = response.text.strip()
     except Exception as exc:
@@ -147,32 +236,52 @@ async def nl_to_sql(question: str) -> str:
     return sql_raw
 
 
-async def format_answer(question: str, sql: str, rows: list[dict]) -> str:
+def prepare_answer_prompt(question: str, sql: str) -> tuple[str, str]:
+    """
+    Build the row-independent head and tail of the format-answer prompt.
+
+    The pipeline calls this while the DB query is still in flight and hands
+    the result to format_answer() via *prompt_parts*.
+    """
+    head = _FMT_HEAD + question + _FMT_AFTER_QUESTION
+    tail = _FMT_AFTER_RESULTS + sql + _FMT_TAIL
+    return head, tail
+
+
+async def format_answer(
+    question: str,
+    sql: str,
+    columns: list[str],
+    rows: list[tuple],
+    prompt_parts: tuple[str, str] | None = None,
+    snapshot: dict | None = None,
+) -> str:
     """
     Send the user question + executed SQL + raw rows to Gemini and get back
     a polished, human-readable answer.
 
     Parameters
     ----------
-    question : str   – original natural-language question
-    sql      : str   – the SQL that was actually executed
-    rows     : list  – list of dicts returned by the DB
+    question     : str   – original natural-language question
+    sql          : str   – the SQL that was actually executed
+    columns      : list  – result column names, in order
+    rows         : list  – row tuples returned by the DB (same order as columns)
+    prompt_parts : tuple – optional (head, tail) from prepare_answer_prompt()
+    snapshot     : dict  – optional pre-loaded config (see config._snapshot())
 
     Returns
     -------
     str – formatted answer.
     """
-    results_json = json.dumps(rows, indent=2, default=str)
+    if prompt_parts is None:
+        prompt_parts = prepare_answer_prompt(question, sql)
+    head, tail = prompt_parts
 
-    prompt = _FORMAT_ANSWER_PROMPT.format(
-        question=question,
-        sql=sql,
-        results_json=results_json,
-    )
+    prompt = head + _dump_rows(columns, rows) + tail
 
     try:
-        model = _get_model()  # Get model with current config
+        model = _get_model(snapshot)  # Get model with current config
         response = await model.generate_content_async(prompt)
         return response.text.strip()
     except Exception as exc:
-        raise RuntimeError(f"Gemini format_answer call failed: {exc}") from exc
\ No newline at end of file
+        raise RuntimeError(f"Gemini format_answer call failed: {exc}") from exc
@@ -6,13 +6,15 @@ Main FastAPI application entry point.
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 
-from database import engine, Base, test_connection
+from database import engine, Base, test_connection, close_pool
+from responses import SafeORJSONResponse
 from routes.query_routes import router as query_router
 from routes.health_routes import router as health_router
 from routes.config_routes import router as config_router
-from routes.data_routes import router as data_router
+from routes.data_routes import router as data_router, dispose_engines
 
 
 # ---------------------------------------------------------------------------
@@ -25,6 +27,8 @@ async def lifespan(app: FastAPI):
     # await test_connection()            # raises if DB unreachable
     # print("[ClearQuote] PostgreSQL connection verified.")
     yield
+    await close_pool()
+    await dispose_engines()
     print("[ClearQuote] Shutting down.")
 
 
@@ -36,6 +40,7 @@ app = FastAPI(
     description="Converts natural-language questions about vehicles, damages, repairs & quotes into SQL, executes them, and returns human-readable answers.",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=SafeORJSONResponse,
 )
 
 app.add_middleware(
@@ -46,6 +51,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# /api/data/fetch can return megabytes of rows
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
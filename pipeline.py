@@ -5,26 +5,32 @@ This module is the single place that orchestrates the full flow.
 Every public endpoint calls one of the functions here.
 """
 
-from sqlalchemy import text
-from database import get_session_factory
-from gemini_client import nl_to_sql, format_answer
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from config import config
+from database import execute_select
+from gemini_client import nl_to_sql, format_answer, prepare_answer_prompt
 from sql_validator import validate_sql
 
 
 # ---------------------------------------------------------------------------
 # Pipeline result dataclass (plain dict-compatible)
 # ---------------------------------------------------------------------------
+@dataclass(slots=True)
 class PipelineResult:
     """Holds every piece of information the API response needs."""
 
-    def __init__(self):
-        self.question: str        = ""
-        self.generated_sql: str   = ""          # raw output from Gemini
-        self.validated_sql: str   = ""          # after safety checks
-        self.rows: list[dict]     = []          # DB result rows
-        self.answer: str          = ""          # Gemini-formatted answer
-        self.error: str | None    = None        # first error if any
-        self.stage: str           = "init"      # last completed stage
+    question: str        = ""
+    generated_sql: str   = ""          # raw output from Gemini
+    validated_sql: str   = ""          # after safety checks
+    columns: list[str]   = field(default_factory=list)   # result column names
+    rows: list[tuple]    = field(default_factory=list)   # DB result rows (per columns)
+    answer: str          = ""          # Gemini-formatted answer
+    error: str | None    = None        # first error if any
+    stage: str           = "init"      # last completed stage
 
     def to_dict(self) -> dict:
         return {
@@ -38,6 +44,56 @@ class PipelineResult:
         }
 
 
+_NOT_ANSWERABLE = "NOT_ANSWERABLE"
+
+
+# ---------------------------------------------------------------------------
+# Answer cache – identical questions skip both Gemini calls and the DB query.
+# The TTL is kept short because queries default to a rolling 30-day window.
+# ---------------------------------------------------------------------------
+_CACHE_MAXSIZE = 1024
+_CACHE_TTL_S   = 300.0
+
+# normalised question -> (stored_at, generated_sql, validated_sql, columns, rows, answer)
+_answer_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def _cache_key(question: str) -> str:
+    return " ".join(question.lower().split())
+
+
+def _cache_get(key: str) -> tuple | None:
+    entry = _answer_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] > _CACHE_TTL_S:
+        del _answer_cache[key]
+        return None
+    _answer_cache.move_to_end(key)
+    return entry
+
+
+def _cache_put(key: str, result: "PipelineResult") -> None:
+    _answer_cache[key] = (
+        time.monotonic(),
+        result.generated_sql,
+        result.validated_sql,
+        result.columns,
+        result.rows,
+        result.answer,
+    )
+    _answer_cache.move_to_end(key)
+    while len(_answer_cache) > _CACHE_MAXSIZE:
+        _answer_cache.popitem(last=False)
+
+
+def clear_answer_cache() -> int:
+    """Drop every cached answer. Returns the number of entries removed."""
+    removed = len(_answer_cache)
+    _answer_cache.clear()
+    return removed
+
+
 # ---------------------------------------------------------------------------
 # Main pipeline
 # ---------------------------------------------------------------------------
@@ -46,7 +102,7 @@ async def run_pipeline(question: str) -> PipelineResult:
     Full pipeline:
         1. NL → SQL   (Gemini)
         2. Validate   (sql_validator)
-        3. Execute    (asyncpg via SQLAlchemy)
+        3. Execute    (asyncpg pool)
         4. Format     (Gemini)
 
     Errors are caught per-stage so the caller always gets a result object,
@@ -55,11 +111,27 @@ async def run_pipeline(question: str) -> PipelineResult:
     result = PipelineResult()
     result.question = question
 
+    # ------------------------------------------------------------------
+    # Cache – return a recent answer for the same question
+    # ------------------------------------------------------------------
+    cache_key = _cache_key(question)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        (_, result.generated_sql, result.validated_sql,
+         columns, rows, result.answer) = cached
+        result.columns = list(columns)
+        result.rows    = list(rows)
+        result.stage = "cache_hit"
+        return result
+
+    # Read config once; both Gemini calls reuse it
+    snapshot = config._snapshot()
+
     # ------------------------------------------------------------------
     # Stage 1 – NL → SQL
     # ------------------------------------------------------------------
     try:
-        raw_sql = await nl_to_sql(question)
+        raw_sql = await nl_to_sql(question, snapshot)
         result.generated_sql = raw_sql
         result.stage = "nl_to_sql"
     except RuntimeError as exc:
@@ -70,7 +142,11 @@ async def run_pipeline(question: str) -> PipelineResult:
     # ------------------------------------------------------------------
     # Guard – Gemini said "not answerable"
     # ------------------------------------------------------------------
-    if raw_sql.strip().upper() == "NOT_ANSWERABLE":
+    # nl_to_sql() already strips; compare the exact literal first and only
+    # case-fold when the length could match.
+    if raw_sql == _NOT_ANSWERABLE or (
+        len(raw_sql) == len(_NOT_ANSWERABLE) and raw_sql.upper() == _NOT_ANSWERABLE
+    ):
         result.answer = (
             "Sorry, I can only answer questions related to vehicle cards, "
             "detected damages, repairs, and quotes in the ClearQuote database. "
@@ -96,13 +172,15 @@ async def run_pipeline(question: str) -> PipelineResult:
     # Stage 3 – Execute against PostgreSQL
     # ------------------------------------------------------------------
     try:
-        session_factory = get_session_factory()
-        async with session_factory() as session:
-            db_result = await session.execute(text(validated))
-            columns   = list(db_result.keys())
-            rows      = [dict(zip(columns, row)) for row in db_result.fetchall()]
-        result.rows  = rows
-        result.stage = "executed"
+        db_task      = asyncio.create_task(execute_select(validated))
+        await asyncio.sleep(0)            # let the query hit the wire
+        # The prompt head/tail don't depend on rows – build them meanwhile
+        prompt_parts = prepare_answer_prompt(question, validated)
+        columns, records = await db_task
+        rows           = list(map(tuple, records))  # asyncpg Records -> plain tuples
+        result.columns = columns
+        result.rows    = rows
+        result.stage   = "executed"
     except Exception as exc:
         result.error = f"Database execution failed: {exc}"
         result.stage = "execution_failed"
@@ -112,9 +190,12 @@ async def run_pipeline(question: str) -> PipelineResult:
     # Stage 4 – Format answer with Gemini
     # ------------------------------------------------------------------
     try:
-        answer       = await format_answer(question, validated, rows)
+        answer       = await format_answer(
+            question, validated, columns, rows, prompt_parts, snapshot
+        )
         result.answer = answer
         result.stage  = "completed"
+        _cache_put(cache_key, result)
     except RuntimeError as exc:
         # We still have raw rows – return them with an error note
         result.error  = f"Answer formatting failed: {exc}"
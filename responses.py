@@ -0,0 +1,24 @@
+"""
+ClearQuote – Shared response classes.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class SafeORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson, which also handles DB values orjson
+    can't encode natively (e.g. Decimal from NUMERIC columns) by falling
+    back to str().
+    Subclasses JSONResponse because FastAPI's ORJSONResponse is deprecated.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
@@ -6,11 +6,19 @@ POST /api/config/db-url      – update the PostgreSQL connection string
 GET  /api/config/db-status   – verify current database connection
 """
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import time
+from urllib.parse import urlparse, quote_plus
+
+import asyncpg
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
-import google.generativeai as genai
-from datetime import datetime
+from datetime import datetime, timezone
 from config import config
+from database import close_pool
+from gemini_client import get_genai, invalidate_model_cache
+from pipeline import clear_answer_cache
+from routes.data_routes import invalidate_engine
 
 router = APIRouter(prefix="/api/config", tags=["config"])
 
@@ -37,6 +45,27 @@ class ConfigResponse(BaseModel):
 # ---------------------------------------------------------------------------
 # Helper Functions for Testing Connections
 # ---------------------------------------------------------------------------
+# api_key -> (checked_at, available model count); avoids a Google round-trip
+# on every status poll.
+_api_key_cache: dict[str, tuple[float, int]] = {}
+_API_KEY_CACHE_TTL_S = 60.0
+
+# Lets clients and proxies reuse status responses instead of polling
+_STATUS_CACHE_CONTROL = "public, max-age=30"
+
+
+def _count_models(api_key: str) -> int:
+    """
+    List the models visible to *api_key* on a dedicated client, leaving the
+    SDK's global configuration (used by the pipeline) untouched.
+    """
+    import google.ai.generativelanguage as glm
+
+    # Closing the client releases its gRPC channel
+    with glm.ModelServiceClient(client_options={"api_key": api_key}) as client:
+        return len(list(get_genai().list_models(client=client)))
+
+
 async def test_api_key_connection(api_key: str) -> dict:
     """
     Test if the provided Gemini API key is valid and can authenticate.
@@ -55,19 +84,23 @@ async def test_api_key_connection(api_key: str) -> dict:
                 "is_valid": False
             }
         
-        # Configure genai with the test key
-        genai.configure(api_key=api_key.strip())
-        
-        # Try to list available models to validate the key
-        models = genai.list_models()
-        models_list = list(models)
+        api_key = api_key.strip()
+        now = time.monotonic()
+        cached = _api_key_cache.get(api_key)
+        if cached is not None and now - cached[0] < _API_KEY_CACHE_TTL_S:
+            model_count = cached[1]
+        else:
+            # Try to list available models to validate the key. The SDK call
+            # is blocking, so keep it off the event loop.
+            model_count = await asyncio.to_thread(_count_models, api_key)
+            _api_key_cache[api_key] = (now, model_count)
         
-        if models_list:
+        if model_count:
             return {
                 "status": "valid",
                 "message": "Gemini API key is valid and authenticated",
                 "is_valid": True,
-                "available_models": len(models_list)
+                "available_models": model_count
             }
         else:
             return {
@@ -118,8 +151,6 @@ async def test_database_connection(db_url: str) -> dict:
             }
 
         # ---- NEW LOGIC (Password Encoding) ----
-        from urllib.parse import urlparse, quote_plus
-
         parsed = urlparse(db_url)
 
         username = parsed.username
@@ -133,24 +164,14 @@ async def test_database_connection(db_url: str) -> dict:
 
         safe_sync_url = f"postgresql://{username}:{password}@{host}:{port}/{database}"
 
-        # Convert to async URL
-        async_url = safe_sync_url.replace(
-            "postgresql://",
-            "postgresql+asyncpg://",
-            1
-        )
-
         # --------------------------------------
 
-        from sqlalchemy.ext.asyncio import create_async_engine
-        from sqlalchemy import text
-
-        test_engine = create_async_engine(async_url, echo=False)
-
-        async with test_engine.connect() as conn:
-            await conn.execute(text("SELECT 1"))
-
-        await test_engine.dispose()
+        # A bare asyncpg connection is enough for a probe – no engine or pool
+        conn = await asyncio.wait_for(asyncpg.connect(dsn=safe_sync_url), timeout=5.0)
+        try:
+            await conn.fetchval("SELECT 1")
+        finally:
+            await conn.close()
 
         return {
             "status": "connected",
@@ -184,7 +205,13 @@ async def update_api_key(req: UpdateApiKeyRequest):
 
     try:
         # Save to JSON config
+        old_api_key = config.GEMINI_API_KEY
         config.GEMINI_API_KEY = req.api_key.strip()
+        invalidate_model_cache()
+        # Cached answers were generated with the previous key's model
+        clear_answer_cache()
+        if old_api_key and old_api_key != config.GEMINI_API_KEY:
+            _api_key_cache.pop(old_api_key, None)
         
         return ConfigResponse(
             message=f"API key updated successfully and saved to configuration",
@@ -214,7 +241,14 @@ async def update_db_url(req: UpdateDbUrlRequest):
 
     try:
         # Save to JSON config
+        old_db_url = config.DB_URL
         config.DB_URL = req.db_url.strip()
+        if config.DB_URL != old_db_url:
+            await invalidate_engine(old_db_url)
+            # get_pool() reconnects to the new DB_URL on next use
+            await close_pool()
+            # Cached answers came from the previous database
+            clear_answer_cache()
         
         return ConfigResponse(
             message="DB URL updated successfully and saved to configuration",
@@ -228,15 +262,14 @@ async def update_db_url(req: UpdateDbUrlRequest):
 # GET /api/config/status – verify current configuration
 # ---------------------------------------------------------------------------
 @router.get("/status", response_model=dict)
-async def get_config_status():
+async def get_config_status(response: Response):
     """
     Returns the current configuration status.
     Shows which configuration values are set.
     """
+    response.headers["Cache-Control"] = _STATUS_CACHE_CONTROL
     return {
-        "gemini_api_key_set": config.GEMINI_API_KEY is not None,
-        "db_url_set": config.DB_URL is not None,
-        "gemini_model": config.GEMINI_MODEL,
+        **config.get_config_status(),
         "validation": config.validate_config()
     }
 
@@ -245,11 +278,12 @@ async def get_config_status():
 # GET /api/config/api-key-status – verify Gemini API key validity
 # ---------------------------------------------------------------------------
 @router.get("/api-key-status", response_model=dict)
-async def get_api_key_status():
+async def get_api_key_status(response: Response):
     """
     Returns the current Gemini API key status.
     Tests if the key is valid and can authenticate with Google Generative AI.
     """
+    response.headers["Cache-Control"] = _STATUS_CACHE_CONTROL
     result = await test_api_key_connection(config.GEMINI_API_KEY)
     return result
 
@@ -263,8 +297,11 @@ async def test_all_connections():
     Tests both database and API key connections.
     Returns a comprehensive status report for both services.
     """
-    db_result = await test_database_connection(config.DB_URL)
-    api_result = await test_api_key_connection(config.GEMINI_API_KEY)
+    # Independent probes – run them side by side
+    db_result, api_result = await asyncio.gather(
+        test_database_connection(config.DB_URL),
+        test_api_key_connection(config.GEMINI_API_KEY),
+    )
     
     overall_status = "healthy" if (db_result.get("is_connected") and api_result.get("is_valid")) else "degraded"
     
@@ -272,7 +309,7 @@ async def test_all_connections():
         "overall_status": overall_status,
         "database": db_result,
         "gemini_api": api_result,
-        "timestamp": str(datetime.now()), 
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
     }
 
 
@@ -5,14 +5,15 @@ POST /api/data/fetch – get all data from specified table(s)
 Supported tables: damage_detections, repairs, quotes, vehicle_cards
 """
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-from typing import List, Dict, Any
-from contextlib import asynccontextmanager
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine
+from typing import List, Dict, Any, Tuple
 from config import config
+from responses import SafeORJSONResponse
 
 router = APIRouter(prefix="/api/data", tags=["data"])
 
@@ -35,21 +36,34 @@ class FetchDataResponse(BaseModel):
 
 
 # Allowed tables
-ALLOWED_TABLES = {
+ALLOWED_TABLES: frozenset[str] = frozenset({
     "vehicle_cards",
     "damage_detections",
     "repairs",
     "quotes"
+})
+
+# One prebuilt statement per table, so the SQL text is identical on every
+# call and asyncpg can reuse its per-connection prepared statement.
+_TABLE_QUERIES = {
+    name: text(f"SELECT * FROM {name} LIMIT :limit") for name in ALLOWED_TABLES
 }
 
 
 # ---------------------------------------------------------------------------
 # Database Session Factory
 # ---------------------------------------------------------------------------
-def get_async_engine():
+# One engine (and connection pool) plus its session factory per configured
+# DB URL, reused across requests. Entries are dropped when the URL changes
+# or on shutdown.
+_engine_cache: Dict[str, Tuple[AsyncEngine, async_sessionmaker]] = {}
+_engine_lock = asyncio.Lock()
+
+
+async def _engine_entry() -> Tuple[AsyncEngine, async_sessionmaker]:
     """
-    Creates an async database engine using the current DB_URL from config.
-    This ensures we always use the latest configuration.
+    Returns the cached (engine, session factory) for the current DB_URL from
+    config, creating them on first use. A changed URL gets a new engine.
     """
     db_url = config.DB_URL
     
@@ -58,6 +72,10 @@ def get_async_engine():
             status_code=500,
             detail="Database URL is not configured. Please configure it via /api/config/db-url"
         )
+
+    entry = _engine_cache.get(db_url)
+    if entry is not None:
+        return entry
     
     # Convert postgresql:// to postgresql+asyncpg://
     if db_url.startswith("postgresql://"):
@@ -69,32 +87,91 @@ def get_async_engine():
             status_code=500,
             detail="Invalid database URL format. Must be a PostgreSQL connection string."
         )
-    
-    return create_async_engine(async_url, echo=False, pool_pre_ping=True)
+
+    async with _engine_lock:
+        entry = _engine_cache.get(db_url)
+        if entry is None:
+            engine = create_async_engine(
+                async_url,
+                echo=False,
+                pool_size=20,
+                max_overflow=10,
+                # Recycle stale connections instead of pinging on every checkout
+                pool_recycle=1800,
+            )
+            entry = (engine, async_sessionmaker(engine, expire_on_commit=False))
+            _engine_cache[db_url] = entry
+    return entry
+
+
+async def get_async_engine() -> AsyncEngine:
+    """
+    Returns the cached async engine for the current configuration.
+    """
+    engine, _ = await _engine_entry()
+    return engine
 
 
-@asynccontextmanager
-async def get_async_session():
+async def invalidate_engine(db_url: str | None) -> None:
     """
-    Context manager for async database sessions.
-    Creates a new session using the current configuration.
+    Dispose and forget the cached engine (and session factory) for *db_url*.
     """
-    engine = get_async_engine()
-    async_session_factory = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-    
-    async with async_session_factory() as session:
-        try:
-            yield session
-        finally:
-            await engine.dispose()
+    if not db_url:
+        return
+    async with _engine_lock:
+        entry = _engine_cache.pop(db_url, None)
+    if entry is not None:
+        await entry[0].dispose()
+
+
+async def dispose_engines() -> None:
+    """
+    Dispose every cached engine (called on application shutdown).
+    """
+    async with _engine_lock:
+        engines = [engine for engine, _ in _engine_cache.values()]
+        _engine_cache.clear()
+    for engine in engines:
+        await engine.dispose()
+
+
+async def get_async_session_factory() -> async_sessionmaker:
+    """
+    Returns the session factory bound to the pooled engine for the current
+    configuration.
+    """
+    _, session_factory = await _engine_entry()
+    return session_factory
+
+
+async def _fetch_one(session_factory, table_name: str, limit: int) -> List[Dict[str, Any]]:
+    """
+    Fetch up to *limit* rows from one table on its own session, so several
+    tables can be read concurrently from the pool.
+    """
+    try:
+        async with session_factory() as session:
+            # Fetch data from the table
+            query = _TABLE_QUERIES[table_name]
+            result = await session.execute(query, {"limit": limit})
+
+            # One pass straight from the mappings – no Row objects
+            return [dict(m) for m in result.mappings()]
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error fetching data from table '{table_name}': {str(e)}"
+        )
 
 
 # ---------------------------------------------------------------------------
 # POST /api/data/fetch – get all data from specified tables
 # ---------------------------------------------------------------------------
-@router.post("/fetch", response_model=FetchDataResponse)
+@router.post(
+    "/fetch",
+    response_class=SafeORJSONResponse,
+    responses={200: {"model": FetchDataResponse}},
+)
 async def fetch_data(req: FetchDataRequest):
     """
     Fetches all data from the specified table(s).
@@ -107,16 +184,17 @@ async def fetch_data(req: FetchDataRequest):
     
     Returns all rows from the specified tables, limited by the 'limit' parameter.
     """
-    # Validate table names
-    requested_tables = set(req.tables)
-    invalid_tables = requested_tables - ALLOWED_TABLES
-    
-    if invalid_tables:
+    # Validate table names – the common all-valid case allocates nothing
+    if any(t not in ALLOWED_TABLES for t in req.tables):
+        invalid_tables = dict.fromkeys(t for t in req.tables if t not in ALLOWED_TABLES)
         raise HTTPException(
             status_code=400,
             detail=f"Invalid table names: {', '.join(invalid_tables)}. "
                    f"Allowed tables: {', '.join(ALLOWED_TABLES)}"
         )
+
+    # De-duplicate while keeping the caller's order
+    requested_tables = dict.fromkeys(req.tables)
     
     if not requested_tables:
         raise HTTPException(
@@ -134,33 +212,29 @@ async def fetch_data(req: FetchDataRequest):
     row_counts = {}
 
     try:
-        async with get_async_session() as session:
-            for table_name in requested_tables:
-                try:
-                    # Fetch data from the table
-                    query = text(f"SELECT * FROM {table_name} LIMIT :limit")
-                    result = await session.execute(query, {"limit": req.limit})
-                    rows = result.fetchall()
-                    
-                    # Convert Row objects to dictionaries
-                    row_dicts = [dict(row._mapping) for row in rows]
-                    
-                    result_data[table_name] = row_dicts
-                    row_counts[table_name] = len(row_dicts)
-                    
-                except Exception as e:
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"Error fetching data from table '{table_name}': {str(e)}"
-                    )
-        
-        return FetchDataResponse(
-            status="success",
-            message=f"Successfully fetched data from {len(requested_tables)} table(s)",
-            data=result_data,
-            row_counts=row_counts
+        session_factory = await get_async_session_factory()
+        tables = list(requested_tables)
+
+        # Tables are independent – query them concurrently on separate connections
+        results = await asyncio.gather(
+            *(_fetch_one(session_factory, t, req.limit) for t in tables),
+            return_exceptions=True,
         )
 
+        for table_name, row_dicts in zip(tables, results):
+            if isinstance(row_dicts, BaseException):
+                raise row_dicts
+            result_data[table_name] = row_dicts
+            row_counts[table_name] = len(row_dicts)
+        
+        # Returned as a plain dict so FastAPI doesn't re-validate every row
+        return {
+            "status": "success",
+            "message": f"Successfully fetched data from {len(requested_tables)} table(s)",
+            "data": result_data,
+            "row_counts": row_counts,
+        }
+
     except HTTPException:
         raise
     except Exception as e:
@@ -2,9 +2,10 @@
 ClearQuote â€“ Health & info routes.
 """
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 from sqlalchemy import text
-from database import get_session_factory
+from database import get_autocommit_engine
 from config import config
 from schema_context import SCHEMA_CONTEXT
 from schemas import HealthResponse
@@ -19,9 +20,8 @@ router = APIRouter(prefix="/api", tags=["health"])
 async def health():
     """Quick liveness probe â€“ confirms DB connectivity and reports the model."""
     try:
-        session_factory = get_session_factory()
-        async with session_factory() as session:
-            await session.execute(text("SELECT 1"))
+        async with get_autocommit_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
         db_status = "ok"
     except Exception:
         db_status = "unreachable"
@@ -32,7 +32,10 @@ async def health():
 # ---------------------------------------------------------------------------
 # GET /api/schema
 # ---------------------------------------------------------------------------
+_SCHEMA_BYTES = orjson.dumps({"schema": SCHEMA_CONTEXT})
+
+
 @router.get("/schema")
 async def get_schema():
     """Return the full schema context that is fed to Gemini (useful for debugging)."""
-    return {"schema": SCHEMA_CONTEXT}
\ No newline at end of file
+    return Response(content=_SCHEMA_BYTES, media_type="application/json")
\ No newline at end of file
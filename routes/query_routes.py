@@ -4,12 +4,15 @@ ClearQuote – Query endpoints.
 POST /api/query   – runs the full NL→SQL→Answer pipeline, returns a polished answer.
 POST /api/debug   – same pipeline but also exposes raw DB rows and both SQL variants.
 GET  /api/examples – returns a list of example questions the user can try.
+POST /api/cache/clear – drops every cached pipeline answer.
 """
 
-from fastapi import APIRouter, HTTPException
-from pipeline import run_pipeline
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from pipeline import run_pipeline, clear_answer_cache
 from schemas import QueryRequest, QueryResponse, DebugResponse
 from config import config
+from responses import SafeORJSONResponse
 
 router = APIRouter(prefix="/api", tags=["query"])
 
@@ -17,7 +20,7 @@ router = APIRouter(prefix="/api", tags=["query"])
 # ---------------------------------------------------------------------------
 # POST /api/query   – production endpoint
 # ---------------------------------------------------------------------------
-@router.post("/query", response_model=QueryResponse)
+@router.post("/query", responses={200: {"model": QueryResponse}})
 async def query(req: QueryRequest):
     """
     Takes a natural-language question, runs the full pipeline, and returns
@@ -36,21 +39,14 @@ async def query(req: QueryRequest):
     if result.error and not result.answer:
         raise HTTPException(status_code=422, detail=result.error)
 
-    return QueryResponse(
-        question=result.question,
-        generated_sql=result.generated_sql,
-        validated_sql=result.validated_sql,
-        row_count=len(result.rows),
-        answer=result.answer,
-        error=result.error,
-        stage=result.stage,
-    )
+    # Serialised directly – the dict already matches QueryResponse
+    return SafeORJSONResponse(result.to_dict())
 
 
 # ---------------------------------------------------------------------------
 # POST /api/debug   – developer endpoint (includes raw rows)
 # ---------------------------------------------------------------------------
-@router.post("/debug", response_model=DebugResponse)
+@router.post("/debug", responses={200: {"model": DebugResponse}})
 async def debug(req: QueryRequest):
     """
     Same as /query but also returns the raw database rows in the response.
@@ -68,22 +64,11 @@ async def debug(req: QueryRequest):
     if result.error and not result.answer:
         raise HTTPException(status_code=422, detail=result.error)
 
-    # Serialise any non-JSON-native types (dates, Decimals) to strings
-    safe_rows = []
-    for row in result.rows:
-        safe_rows.append({k: str(v) if not isinstance(v, (int, float, str, bool, type(None))) else v
-                          for k, v in row.items()})
-
-    return DebugResponse(
-        question=result.question,
-        generated_sql=result.generated_sql,
-        validated_sql=result.validated_sql,
-        row_count=len(result.rows),
-        answer=result.answer,
-        error=result.error,
-        stage=result.stage,
-        rows=safe_rows,
-    )
+    # Non-native values (Decimals etc.) are str()'d by orjson's default hook
+    columns = result.columns
+    response = result.to_dict()
+    response["rows"] = [dict(zip(columns, row)) for row in result.rows]
+    return SafeORJSONResponse(response)
 
 
 # ---------------------------------------------------------------------------
@@ -103,7 +88,21 @@ _EXAMPLE_QUESTIONS = [
 ]
 
 
+# The list never changes – serialise it once
+_EXAMPLES_BYTES = orjson.dumps({"examples": _EXAMPLE_QUESTIONS})
+
+
 @router.get("/examples")
 async def examples():
     """Return a curated list of example questions the user can try."""
-    return {"examples": _EXAMPLE_QUESTIONS}
+    return Response(content=_EXAMPLES_BYTES, media_type="application/json")
+
+
+# ---------------------------------------------------------------------------
+# POST /api/cache/clear  – admin: bust the answer cache
+# ---------------------------------------------------------------------------
+@router.post("/cache/clear")
+async def clear_cache():
+    """Drop all cached answers so the next question re-runs the full pipeline."""
+    removed = clear_answer_cache()
+    return {"status": "success", "cleared": removed}
@@ -8,9 +8,13 @@ Designed for Docker usage:
     vehicle_cards, damage_detections, repairs, quotes
 
 Default behavior is idempotent: if a table already has rows, it will be skipped.
+Tables are loaded concurrently (FK parents first), each in its own transaction.
 Set SEED_TRUNCATE=true to TRUNCATE and reload.
 
-Supports CSV out of the box. XLSX is supported if openpyxl is installed.
+Supports CSV out of the box. XLSX is supported if python-calamine or
+openpyxl is installed (calamine is preferred when both are present).
+If pyarrow is installed, CSV files are parsed and type-converted by its
+native reader instead of the csv module.
 """
 
 from __future__ import annotations
@@ -18,11 +22,15 @@ from __future__ import annotations
 import asyncio
 import csv
 import os
+import random
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, date, time
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Iterable
+from time import monotonic
+from typing import Any, Callable, Iterator
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine
@@ -82,91 +90,234 @@ def _to_async_db_url(db_url: str) -> str:
     return db_url
 
 
-async def _wait_for_db(engine, attempts: int = 60, delay_s: float = 1.0) -> None:
+def _seed_db_url() -> str:
+    db_url = os.getenv("DB_URL") or os.getenv("DATABASE_URL")
+    if not db_url:
+        raise RuntimeError("DB_URL (or DATABASE_URL) must be set for seeding.")
+    return db_url
+
+
+@lru_cache(maxsize=1)
+def _seed_engine(db_url: str):
+    """
+    Process-wide seeding engine with one pooled connection per seed table,
+    so the concurrent per-table loads all start on warm connections.
+    """
+    return create_async_engine(
+        _to_async_db_url(db_url),
+        echo=False,
+        pool_pre_ping=True,
+        pool_size=len(SEEDS),
+        max_overflow=0,
+        # Sent in the startup packet, so it holds for the whole session and
+        # can't be reverted by a rolled-back transaction. One-shot bulk load:
+        # no need to wait for the WAL flush on commit.
+        connect_args={"server_settings": {"synchronous_commit": "off"}},
+    )
+
+
+async def _wait_for_db(
+    engine,
+    timeout_s: float = 60.0,
+    base_delay_s: float = 0.05,
+    max_delay_s: float = 2.0,
+    jitter_s: float = 0.1,
+) -> None:
+    # Exponential backoff with jitter: a DB that comes up in a few seconds is
+    # noticed almost immediately, while the total wait is bounded by a deadline.
+    deadline = monotonic() + timeout_s
     last_err: Exception | None = None
-    for _ in range(attempts):
+    attempt = 0
+    while True:
         try:
             async with engine.connect() as conn:
                 await conn.execute(text("SELECT 1"))
             return
         except Exception as e:  # noqa: BLE001 - startup wait loop
             last_err = e
-            await asyncio.sleep(delay_s)
-    raise RuntimeError(f"Database not reachable after {attempts} attempts: {last_err}") from last_err
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            break
+        delay = min(max_delay_s, base_delay_s * (2 ** attempt)) + random.uniform(0, jitter_s)
+        await asyncio.sleep(min(delay, remaining))
+        attempt += 1
+    raise RuntimeError(
+        f"Database not reachable after {attempt + 1} attempts ({timeout_s:.0f}s): {last_err}"
+    ) from last_err
+
+
+_BOOL_TRUE = frozenset({"true", "t", "1", "yes", "y", "True", "TRUE", "T", "Yes", "YES", "Y"})
+_BOOL_FALSE = frozenset({"false", "f", "0", "no", "n", "False", "FALSE", "F", "No", "NO", "N"})
 
 
 def _parse_bool(value: str) -> bool:
+    # Fast path: the common spellings match as-is, without strip()/lower()
+    if value in _BOOL_TRUE:
+        return True
+    if value in _BOOL_FALSE:
+        return False
     v = value.strip().lower()
-    if v in {"true", "t", "1", "yes", "y"}:
+    if v in _BOOL_TRUE:
         return True
-    if v in {"false", "f", "0", "no", "n"}:
+    if v in _BOOL_FALSE:
         return False
     raise ValueError(f"Invalid boolean: {value!r}")
 
 
 def _parse_datetime(value: str) -> datetime:
     v = value.strip()
-    # Accept "YYYY-MM-DD" or ISO datetime.
+    # Accept "YYYY-MM-DD" or ISO datetime; pick the parser up front instead
+    # of trying one and catching the failure.
+    if "T" in v or " " in v:
+        return datetime.fromisoformat(v)
+    return datetime.combine(date.fromisoformat(v), time.min)
+
+
+_COERCERS: dict[type, Callable[[str], Any]] = {
+    Integer: int,
+    Float: float,
+    Boolean: _parse_bool,
+    Numeric: Decimal,
+    DateTime: _parse_datetime,
+}
+
+# Dispatch key (a _COERCERS base type, or None for text) per concrete
+# SQLAlchemy type class, so the MRO is walked once per class rather than
+# once per column.
+_TYPE_KEY_BY_CLASS: dict[type, type | None] = {}
+
+
+def _type_key(ctype: Any) -> type | None:
+    cls = type(ctype)
     try:
-        dt = datetime.fromisoformat(v)
-        if isinstance(dt, datetime):
-            return dt
-    except ValueError:
-        pass
-    d = date.fromisoformat(v)
-    return datetime.combine(d, time.min)
-
-
-def _coerce_row_for_model(row: dict[str, str], model: Any) -> dict[str, Any]:
-    table = model.__table__
-    out: dict[str, Any] = {}
-    for key, raw in row.items():
-        col = table.columns.get(key)
-        if col is None:
-            continue
-        if raw is None:
-            out[key] = None
-            continue
-        s = raw.strip()
-        if s == "":
-            out[key] = None
+        return _TYPE_KEY_BY_CLASS[cls]
+    except KeyError:
+        # First match in MRO order, so Float wins over its base Numeric
+        key = next((base for base in cls.__mro__ if base in _COERCERS), None)
+        _TYPE_KEY_BY_CLASS[cls] = key
+        return key
+
+
+def _coercer_for_type(ctype: Any) -> Callable[[str], Any]:
+    return _COERCERS.get(_type_key(ctype), str)
+
+
+Coercer = tuple[int, str, Callable[[str], Any]]
+
+# Categorical text columns whose handful of distinct values repeat on every
+# row; interning makes each row share one str object per value.
+_INTERNED_COLUMNS = frozenset({
+    "vehicle_type", "manufacturer", "model",
+    "panel_name", "damage_type", "severity", "repair_action", "currency",
+})
+
+
+def _column_types(model: Any) -> dict[str, Any]:
+    """
+    Plain {column name: SQLAlchemy type} dict for *model*'s table; cheaper to
+    probe per header than the ColumnCollection itself.
+    """
+    return {name: col.type for name, col in model.__table__.columns.items()}
+
+
+def _build_coercer(model: Any, headers: list[str]) -> list[Coercer]:
+    """
+    Resolve, once per table, the (position, column, parse function) for every
+    file header that maps to a table column, so the per-row loop does no
+    lookups or type dispatch.
+    """
+    col_types = _column_types(model)
+    plan: list[Coercer] = []
+    for idx, key in enumerate(headers):
+        ctype = col_types.get(key)
+        if ctype is None:
             continue
+        fn = _coercer_for_type(ctype)
+        if fn is str and key in _INTERNED_COLUMNS:
+            fn = sys.intern
+        plan.append((idx, key, fn))
+    return plan
+
 
-        ctype = col.type
+def _coerce_row_for_model(row: list[str], coercers: list[Coercer], table_name: str) -> tuple[Any, ...]:
+    out: list[Any] = []
+    for idx, key, fn in coercers:
+        s = row[idx].strip()
         try:
-            if isinstance(ctype, Integer):
-                out[key] = int(s)
-            elif isinstance(ctype, Float):
-                out[key] = float(s)
-            elif isinstance(ctype, Boolean):
-                out[key] = _parse_bool(s)
-            elif isinstance(ctype, Numeric):
-                out[key] = Decimal(s)
-            elif isinstance(ctype, DateTime):
-                out[key] = _parse_datetime(s)
-            else:
-                out[key] = s
+            out.append(fn(s) if s else None)
         except Exception as e:  # noqa: BLE001 - add context
-            raise ValueError(f"Failed to coerce column {table.name}.{key} from {s!r}") from e
+            raise ValueError(f"Failed to coerce column {table_name}.{key} from {s!r}") from e
 
-    return out
+    return tuple(out)
 
 
-def _read_csv_rows(path: Path) -> Iterable[dict[str, str]]:
-    with path.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+# The _read_*_rows readers yield the header row first, then each data row as a
+# list of strings padded to the header width.
+
+def _read_csv_rows(path: Path) -> Iterator[list[str]]:
+    # Large read buffer keeps read() syscalls down on big files
+    with path.open("r", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        headers = next(reader, None)
+        if not headers:
+            return
+        yield [h.strip() for h in headers]
+
+        width = len(headers)
         for row in reader:
-            # DictReader returns dict[str, str | None]; normalize to str
-            yield {k: (v if v is not None else "") for k, v in row.items()}
+            if not row:
+                continue  # blank line
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+            yield row
+
+
+def _xlsx_cell_str(value: Any) -> str:
+    if value is None or value == "":
+        return ""
+    # Calamine reports every number as float; keep "3" parseable by int()
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _read_xlsx_rows_calamine(path: Path, workbook_cls: Any) -> Iterator[list[str]]:
+    wb = workbook_cls.from_path(str(path))
+    try:
+        rows_iter = wb.get_sheet_by_index(0).iter_rows()
+        headers = next(rows_iter, None)
+        if not headers:
+            return
 
+        keys = [str(h).strip() for h in headers]
+        yield keys
+
+        width = len(keys)
+        for r in rows_iter:
+            row = [_xlsx_cell_str(v) for v in r[:width]]
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+            yield row
+    finally:
+        wb.close()
+
+
+def _read_xlsx_rows(path: Path) -> Iterator[list[str]]:
+    # Rust-backed reader, much faster than openpyxl's pure-Python XML parsing
+    try:
+        from python_calamine import CalamineWorkbook  # type: ignore
+    except Exception:  # noqa: BLE001 - optional dependency
+        CalamineWorkbook = None
+    if CalamineWorkbook is not None:
+        yield from _read_xlsx_rows_calamine(path, CalamineWorkbook)
+        return
 
-def _read_xlsx_rows(path: Path) -> Iterable[dict[str, str]]:
     try:
         import openpyxl  # type: ignore
     except Exception as e:  # noqa: BLE001
         raise RuntimeError(
-            "XLSX seeding requires 'openpyxl'. "
-            "Either install it (pip install openpyxl) or export the file to CSV."
+            "XLSX seeding requires 'python-calamine' or 'openpyxl'. "
+            "Either install one (pip install python-calamine) or export the file to CSV."
         ) from e
 
     wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
@@ -175,15 +326,20 @@ def _read_xlsx_rows(path: Path) -> Iterable[dict[str, str]]:
     rows_iter = ws.iter_rows(values_only=True)
     headers = next(rows_iter, None)
     if not headers:
-        return []
+        return
 
     keys = [str(h).strip() for h in headers]
+    yield keys
+
+    width = len(keys)
     for r in rows_iter:
-        row = {keys[i]: ("" if r[i] is None else str(r[i])) for i in range(len(keys))}
+        row = ["" if v is None else str(v) for v in r[:width]]
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
         yield row
 
 
-def _read_rows(path: Path) -> Iterable[dict[str, str]]:
+def _read_rows(path: Path) -> Iterator[list[str]]:
     if path.suffix.lower() == ".csv":
         return _read_csv_rows(path)
     if path.suffix.lower() in {".xlsx", ".xlsm"}:
@@ -191,113 +347,315 @@ def _read_rows(path: Path) -> Iterable[dict[str, str]]:
     raise RuntimeError(f"Unsupported dataset file type: {path.name}")
 
 
-async def _table_row_count(conn, table_name: str) -> int:
-    res = await conn.execute(text(f'SELECT COUNT(*) FROM "{table_name}"'))
-    return int(res.scalar_one())
+# pyarrow equivalents of _COERCERS, keyed the same way (see _type_key)
+_ARROW_TYPES: dict[type, Callable[[Any, Any], Any]] = {
+    Integer: lambda pa, ctype: pa.int64(),
+    Float: lambda pa, ctype: pa.float64(),
+    Boolean: lambda pa, ctype: pa.bool_(),
+    Numeric: lambda pa, ctype: pa.decimal128(ctype.precision or 38, ctype.scale or 0),
+    DateTime: lambda pa, ctype: pa.timestamp("us"),
+}
 
 
-async def _set_sequence(conn, table_name: str, pk_name: str) -> None:
-    # Works for SERIAL/IDENTITY-backed PKs. Safe no-op if no sequence exists.
-    await conn.execute(
-        text(
-            """
+def _arrow_type(pa: Any, ctype: Any) -> Any:
+    factory = _ARROW_TYPES.get(_type_key(ctype))
+    return factory(pa, ctype) if factory is not None else pa.string()
+
+
+_BOOL_TRUE_VALUES = sorted(_BOOL_TRUE)
+_BOOL_FALSE_VALUES = sorted(_BOOL_FALSE)
+
+
+def _read_csv_records_arrow(path: Path, model: Any) -> tuple[list[str], Iterator[tuple[Any, ...]]] | None:
+    """
+    Parse and type-convert a CSV in one native pass with pyarrow.
+    Returns (column names, row tuples), or None if pyarrow isn't installed
+    or can't parse the file.
+    """
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.csv as pa_csv  # type: ignore
+    except Exception:  # noqa: BLE001 - optional dependency
+        return None
+
+    with path.open("r", newline="", encoding="utf-8") as f:
+        headers = [h.strip() for h in next(csv.reader(f), [])]
+
+    col_types = _column_types(model)
+    col_names = [h for h in headers if h in col_types]
+    if not col_names:
+        return col_names, iter(())
+
+    convert_options = pa_csv.ConvertOptions(
+        column_types={name: _arrow_type(pa, col_types[name]) for name in col_names},
+        include_columns=col_names,
+        # Match the csv path: only empty cells are NULL, for every column type
+        null_values=[""],
+        strings_can_be_null=True,
+        true_values=_BOOL_TRUE_VALUES,
+        false_values=_BOOL_FALSE_VALUES,
+    )
+    try:
+        # Memory-mapped source: blocks are parsed straight from the page
+        # cache, in parallel, with no Python-level reads.
+        with pa.memory_map(str(path), "r") as source:
+            table = pa_csv.read_csv(
+                source,
+                # Name the columns ourselves so the stripped headers above are
+                # what include_columns / column_types match against
+                read_options=pa_csv.ReadOptions(
+                    column_names=headers, skip_rows=1, block_size=8 << 20, use_threads=True,
+                ),
+                convert_options=convert_options,
+            )
+    except (pa.ArrowException, KeyError) as e:
+        # e.g. a value the strict native parser rejects – let the csv path decide
+        print(f"[seed] pyarrow could not parse {path.name} ({e}); falling back to csv module.")
+        return None
+    return col_names, zip(*(_arrow_column_values(pa, table, name) for name in col_names))
+
+
+def _arrow_column_values(pa: Any, table: Any, name: str) -> list[Any]:
+    """
+    Python values for one parsed column, normalised like the csv path:
+    text is stripped, blank becomes None, categorical columns are interned.
+    Typed columns need nothing here: pyarrow either tolerates the padding
+    (numbers) or rejects the value, which sends the file down the csv path.
+    """
+    col = table.column(name)
+    if not pa.types.is_string(col.type):
+        return col.to_pylist()
+
+    import pyarrow.compute as pc  # type: ignore
+
+    col = pc.utf8_trim_whitespace(col)
+    col = pc.if_else(pc.equal(col, ""), pa.scalar(None, pa.string()), col)
+    values = col.to_pylist()
+    if name in _INTERNED_COLUMNS:
+        intern = sys.intern
+        values = [None if v is None else intern(v) for v in values]
+    return values
+
+
+def _iter_records(path: Path, spec: TableSeed) -> tuple[list[str], Iterator[tuple[Any, ...]]]:
+    """
+    (column names, row tuples in that order) for one dataset file.
+    """
+    if path.suffix.lower() == ".csv":
+        arrow = _read_csv_records_arrow(path, spec.model)
+        if arrow is not None:
+            return arrow
+
+    rows_iter = _read_rows(path)
+    headers = next(rows_iter, None)
+    coercers = _build_coercer(spec.model, headers) if headers else []
+    records = (_coerce_row_for_model(r, coercers, spec.table_name) for r in rows_iter)
+    return [key for _, key, _ in coercers], records
+
+
+async def _table_row_counts(conn, table_names: list[str]) -> dict[str, int]:
+    """
+    Exact row counts for several tables in a single round-trip.
+    """
+    sql = " UNION ALL ".join(
+        f"SELECT '{name}', COUNT(*) FROM \"{name}\"" for name in table_names
+    )
+    res = await conn.execute(text(sql))
+    return {name: int(count) for name, count in res.all()}
+
+
+_SECONDARY_INDEXES_SQL = text(
+    """
+    SELECT i.indexname, i.indexdef
+    FROM pg_indexes i
+    WHERE i.schemaname = current_schema()
+      AND i.tablename = :t
+      AND NOT EXISTS (
+        SELECT 1 FROM pg_constraint c
+        WHERE c.conname = i.indexname
+          AND c.conrelid = to_regclass(quote_ident(:t))
+      )
+    """
+)
+
+
+async def _drop_secondary_indexes(conn, table_name: str) -> list[str]:
+    """
+    Drop every index on *table_name* that doesn't back a constraint (PK,
+    UNIQUE, EXCLUDE) and return their CREATE INDEX statements.
+    """
+    rows = (await conn.execute(_SECONDARY_INDEXES_SQL, {"t": table_name})).all()
+    for name, _ in rows:
+        await conn.execute(text(f'DROP INDEX "{name}"'))
+    return [indexdef for _, indexdef in rows]
+
+
+# (table, pk) -> compiled setval() statement; identifiers can't be bound, so
+# they are formatted in once here, only for tables/PKs declared in SEEDS.
+_SEQUENCE_STMTS: dict[tuple[str, str], Any] = {}
+
+
+def _sequence_stmt(table_name: str, pk_name: str) -> Any:
+    key = (table_name, pk_name)
+    stmt = _SEQUENCE_STMTS.get(key)
+    if stmt is None:
+        known = {
+            (spec.table_name, c.name)
+            for spec in SEEDS
+            for c in spec.model.__table__.primary_key.columns
+        }
+        if key not in known:
+            raise ValueError(f"Unknown seed table/primary key: {table_name}.{pk_name}")
+        stmt = text(
+            f"""
             SELECT setval(
-              pg_get_serial_sequence(:table, :pk),
-              COALESCE((SELECT MAX(%(pk)s) FROM "%(table)s"), 1),
+              pg_get_serial_sequence(:t, :p),
+              COALESCE((SELECT MAX("{pk_name}") FROM "{table_name}"), 1),
               true
             )
             """
-            % {"pk": pk_name, "table": table_name}
-        ),
-        {"table": table_name, "pk": pk_name},
+        )
+        _SEQUENCE_STMTS[key] = stmt
+    return stmt
+
+
+async def _set_sequence(conn, table_name: str, pk_name: str) -> None:
+    # Works for SERIAL/IDENTITY-backed PKs. Safe no-op if no sequence exists:
+    # pg_get_serial_sequence() then returns NULL and the strict setval()
+    # returns NULL without touching anything.
+    await conn.execute(
+        _sequence_stmt(table_name, pk_name),
+        {"t": table_name, "p": pk_name},
     )
 
 
-async def seed() -> None:
-    db_url = os.getenv("DB_URL") or os.getenv("DATABASE_URL")
-    if not db_url:
-        raise RuntimeError("DB_URL (or DATABASE_URL) must be set for seeding.")
+def _dependency_levels(seeds: list[TableSeed]) -> list[list[TableSeed]]:
+    """
+    Group *seeds* so every table comes after the seeded tables its foreign
+    keys point at; tables within one level can be loaded concurrently.
+    """
+    names = {spec.table_name for spec in seeds}
+    parents = {
+        spec.table_name: {
+            fk.column.table.name for fk in spec.model.__table__.foreign_keys
+        } & (names - {spec.table_name})
+        for spec in seeds
+    }
+    levels: list[list[TableSeed]] = []
+    done: set[str] = set()
+    remaining = list(seeds)
+    while remaining:
+        level = [spec for spec in remaining if parents[spec.table_name] <= done]
+        if not level:
+            raise RuntimeError("Circular foreign keys between seed tables.")
+        levels.append(level)
+        done.update(spec.table_name for spec in level)
+        remaining = [spec for spec in remaining if spec.table_name not in done]
+    return levels
+
+
+async def _seed_one(engine, spec: TableSeed, root: Path, existing: int) -> None:
+    """
+    Load one table on its own connection and transaction.
+    *existing* is the table's row count from before any loading started.
+    """
+    table = spec.model.__table__
+    pk_cols = [c.name for c in table.primary_key.columns]
+    pk_name = pk_cols[0] if pk_cols else None
+
+    env_key = f"SEED_{spec.table_name.upper()}_FILE"
+    dataset_path = Path(os.getenv(env_key, str(root / spec.default_filename)))
+
+    async with engine.begin() as conn:
+        if existing > 0:
+            print(f"[seed] Skipping {spec.table_name}: already has {existing} rows.")
+            return
+
+        if not dataset_path.exists():
+            raise FileNotFoundError(
+                f"Dataset file not found for {spec.table_name}: {dataset_path} "
+                f"(override via {env_key} or SEED_DATA_DIR)"
+            )
+
+        print(f"[seed] Loading {spec.table_name} from {dataset_path.name} ...")
+        col_names, records = _iter_records(dataset_path, spec)
+        inserted = 0
+        if col_names:
+            # Building indexes once after COPY beats maintaining them per row
+            index_defs = await _drop_secondary_indexes(conn, spec.table_name)
+
+            # Bulk loads go through asyncpg's binary COPY on the underlying
+            # driver connection, inside this connection's transaction;
+            # asyncpg returns the command tag, e.g. "COPY 100".
+            raw = (await conn.get_raw_connection()).driver_connection
+            status = await raw.copy_records_to_table(
+                spec.table_name, records=records, columns=col_names
+            )
+            inserted = int(status.split()[-1])
+
+            # indexdef is server-generated DDL – run it verbatim
+            for indexdef in index_defs:
+                await conn.exec_driver_sql(indexdef)
+
+        print(f"[seed] Inserted {inserted} rows into {spec.table_name}.")
+
+        if pk_name:
+            # A table without a serial sequence is already a no-op inside
+            # _set_sequence; anything else is a real error.
+            await _set_sequence(conn, spec.table_name, pk_name)
 
+
+async def seed() -> None:
+    db_url = _seed_db_url()
     seed_truncate = _env_bool("SEED_TRUNCATE", default=False)
-    chunk_size = int(os.getenv("SEED_CHUNK_SIZE", "500"))
 
     root = Path(os.getenv("SEED_DATA_DIR", str(_project_root())))
     print(f"[seed] Using data directory: {root}")
-    print(f"[seed] SEED_TRUNCATE={seed_truncate}, SEED_CHUNK_SIZE={chunk_size}")
+    print(f"[seed] SEED_TRUNCATE={seed_truncate}")
 
-    engine = create_async_engine(_to_async_db_url(db_url), echo=False, pool_pre_ping=True)
+    engine = _seed_engine(db_url)
 
-    try:
-        print("[seed] Waiting for Postgres...")
-        await _wait_for_db(engine)
-        print("[seed] Postgres is reachable.")
-
-        async with engine.begin() as conn:
-            print("[seed] Ensuring tables exist (create_all)...")
-            await conn.run_sync(Base.metadata.create_all)
-
-            if seed_truncate:
-                print("[seed] Truncating tables before load...")
-                # Truncate in reverse-ish dependency order; CASCADE handles FKs if present.
-                await conn.execute(
-                    text(
-                        'TRUNCATE TABLE "quotes", "repairs", "damage_detections", "vehicle_cards" RESTART IDENTITY CASCADE'
-                    )
+    print("[seed] Waiting for Postgres...")
+    await _wait_for_db(engine)
+    print("[seed] Postgres is reachable.")
+
+    async with engine.begin() as conn:
+        print("[seed] Ensuring tables exist (create_all)...")
+        await conn.run_sync(Base.metadata.create_all)
+
+        if seed_truncate:
+            print("[seed] Truncating tables before load...")
+            # Truncate in reverse-ish dependency order; CASCADE handles FKs if present.
+            await conn.execute(
+                text(
+                    'TRUNCATE TABLE "quotes", "repairs", "damage_detections", "vehicle_cards" RESTART IDENTITY CASCADE'
                 )
+            )
+            existing = dict.fromkeys((spec.table_name for spec in SEEDS), 0)
+        else:
+            existing = await _table_row_counts(conn, [spec.table_name for spec in SEEDS])
+
+    # Each table loads on its own pooled connection; tables only wait for
+    # the levels holding their FK parents.
+    for level in _dependency_levels(SEEDS):
+        await asyncio.gather(
+            *(_seed_one(engine, spec, root, existing[spec.table_name]) for spec in level)
+        )
+
+    print("[seed] Done.")
 
-            for spec in SEEDS:
-                table = spec.model.__table__
-                pk_cols = [c.name for c in table.primary_key.columns]
-                pk_name = pk_cols[0] if pk_cols else None
-
-                existing = await _table_row_count(conn, spec.table_name)
-                if existing > 0 and not seed_truncate:
-                    print(f"[seed] Skipping {spec.table_name}: already has {existing} rows.")
-                    continue
-
-                env_key = f"SEED_{spec.table_name.upper()}_FILE"
-                dataset_path = Path(os.getenv(env_key, str(root / spec.default_filename)))
-                if not dataset_path.exists():
-                    raise FileNotFoundError(
-                        f"Dataset file not found for {spec.table_name}: {dataset_path} "
-                        f"(override via {env_key} or SEED_DATA_DIR)"
-                    )
-
-                print(f"[seed] Loading {spec.table_name} from {dataset_path.name} ...")
-                rows_iter = _read_rows(dataset_path)
-
-                batch: list[dict[str, Any]] = []
-                inserted = 0
-                for raw_row in rows_iter:
-                    coerced = _coerce_row_for_model(raw_row, spec.model)
-                    if not coerced:
-                        continue
-                    batch.append(coerced)
-                    if len(batch) >= chunk_size:
-                        await conn.execute(table.insert(), batch)
-                        inserted += len(batch)
-                        batch.clear()
-
-                if batch:
-                    await conn.execute(table.insert(), batch)
-                    inserted += len(batch)
-
-                print(f"[seed] Inserted {inserted} rows into {spec.table_name}.")
-
-                if pk_name:
-                    try:
-                        await _set_sequence(conn, spec.table_name, pk_name)
-                    except Exception:
-                        # Not all schemas will have a serial sequence; ignore.
-                        pass
-
-        print("[seed] Done.")
+
+async def _seed_and_dispose() -> None:
+    try:
+        await seed()
     finally:
-        await engine.dispose()
+        # seed() leaves its pool warm for callers that run it repeatedly
+        if _seed_engine.cache_info().currsize:
+            await _seed_engine(_seed_db_url()).dispose()
 
 
 def main() -> None:
-    asyncio.run(seed())
+    asyncio.run(_seed_and_dispose())
 
 
 if __name__ == "__main__":
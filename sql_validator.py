@@ -6,38 +6,116 @@ Responsibilities:
   2. Reject known dangerous keywords / functions.
   3. Strip trailing semicolons (PostgreSQL quirk with asyncpg).
   4. Return a clean, validated query string or raise ValueError.
+
+The query is parsed once with sqlglot (PostgreSQL dialect) and the checks
+walk the resulting AST, so string literals and comments can't trip them.
 """
 
 import re
+from functools import lru_cache
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import SqlglotError
+from sqlglot.optimizer.normalize_identifiers import normalize_identifiers
+from sqlglot.optimizer.scope import traverse_scope
 
 # ---------------------------------------------------------------------------
-# Blocked top-level statements  (case-insensitive)
+# Statement nodes that must never appear anywhere in the tree (DDL / DML,
+# SELECT … INTO, and anything sqlglot could only parse as a raw command)
 # ---------------------------------------------------------------------------
-_BLOCKED_STATEMENTS = re.compile(
-    r"^\s*(DROP|DELETE|INSERT|UPDATE|ALTER|CREATE|TRUNCATE|GRANT|REVOKE|EXEC|CALL)\b",
-    re.IGNORECASE,
+_BLOCKED_NODES = (
+    exp.Insert, exp.Update, exp.Delete, exp.Merge,
+    exp.Create, exp.Drop, exp.Alter, exp.TruncateTable,
+    exp.Grant, exp.Copy, exp.Into, exp.Set,
+    exp.Transaction, exp.Command,
 )
 
 # ---------------------------------------------------------------------------
-# Blocked keywords / functions anywhere in the query
+# Blocked functions  (compared lower-case)
 # ---------------------------------------------------------------------------
-_BLOCKED_TOKENS = re.compile(
-    r"\b(pg_sleep|COPY|EXPLAIN\s+ANALYZE|SET\s+ROLE|"
-    r"pg_read_file|pg_write|pg_dump|system|RAISE|"
-    r"dblink|EXECUTE|FORMAT\s*\(\s*'.*DROP|"
-    r"information_schema|pg_catalog)\b",
-    re.IGNORECASE,
-)
+_BLOCKED_FUNCTIONS = frozenset({
+    "pg_sleep", "pg_sleep_for", "pg_sleep_until",
+    "pg_read_file", "pg_read_binary_file", "pg_ls_dir", "pg_stat_file",
+    "pg_write_file", "pg_file_write", "pg_dump",
+    "lo_import", "lo_export",
+    "dblink", "dblink_exec", "dblink_connect",
+    "set_config", "pg_terminate_backend", "pg_cancel_backend",
+    "query_to_xml", "schema_to_xml", "table_to_xml", "database_to_xml",
+    "system",
+})
 
 # ---------------------------------------------------------------------------
-# Must start with SELECT (after optional WITH for CTEs)
+# Functions sqlglot doesn't model (parsed as exp.Anonymous) are only allowed
+# from this list – that is where the pg_* / *_to_xml / dblink style system
+# functions live.  Functions sqlglot does model are standard SQL.
 # ---------------------------------------------------------------------------
-_ALLOWED_START = re.compile(r"^\s*(WITH\s+.*)?SELECT\b", re.IGNORECASE | re.DOTALL)
+_ALLOWED_ANONYMOUS_FUNCTIONS = frozenset({
+    # string
+    "quote_ident", "quote_literal", "quote_nullable", "octet_length",
+    "regexp_match", "regexp_matches", "regexp_split_to_array", "regexp_split_to_table",
+    # date / time
+    "age", "clock_timestamp", "statement_timestamp", "transaction_timestamp", "timeofday",
+    "timezone", "isfinite", "justify_days", "justify_hours", "justify_interval",
+    "make_date", "make_timestamp", "make_timestamptz", "make_interval",
+    # math / comparison
+    "gcd", "lcm", "num_nonnulls", "num_nulls", "every",
+    # JSON
+    "to_json", "to_jsonb", "row_to_json", "array_to_json",
+    "json_build_array", "jsonb_build_array", "json_build_object", "jsonb_build_object",
+    "jsonb_agg", "json_array_length", "jsonb_array_length",
+    "json_each", "jsonb_each", "json_object_keys", "jsonb_object_keys",
+    "json_typeof", "jsonb_typeof", "jsonb_extract_path", "jsonb_extract_path_text",
+    "jsonb_set", "jsonb_insert", "jsonb_strip_nulls", "jsonb_pretty",
+    # arrays
+    "cardinality", "array_dims", "array_lower", "array_upper", "array_ndims",
+    "array_positions", "array_replace",
+})
+
+# Set-returning functions allowed in FROM position (allowlisted unmodelled
+# ones, e.g. regexp_split_to_table / jsonb_each, are exp.Anonymous)
+_ALLOWED_TABLE_FUNCTIONS = (exp.GenerateSeries, exp.Unnest, exp.Anonymous)
+
+# Schema qualifiers a table reference may carry
+_ALLOWED_SCHEMAS = frozenset({"", "public"})
 
+# ---------------------------------------------------------------------------
+# Markdown code-fence wrapper the LLM sometimes adds  (```sql … ```)
+# ---------------------------------------------------------------------------
+_CODE_FENCE = re.compile(r"^```(?:sql)?\s*\n?|\n?```\s*$", re.IGNORECASE)
 
-def validate_sql(raw_sql: str) -> str:
+_ALLOWED_TABLES = frozenset({"vehicle_cards", "damage_detections", "repairs", "quotes"})
+
+
+_BLOCKED_FUNCTION_MSG = (
+    "Query contains a blocked keyword or function. "
+    "Only standard SELECT queries against ClearQuote tables are permitted."
+)
+
+
+def _function_name(node: exp.Func) -> str:
+    if isinstance(node, exp.Anonymous):
+        return node.name.lower()
+    return node.sql_name().lower()
+
+
+def _cte_references(tree: exp.Expression) -> set[int]:
     """
-    Validate and sanitise *raw_sql*.
+    ids of the exp.Table nodes that resolve to a CTE in their own scope.
+    A name only counts where the CTE is actually visible – e.g. not inside
+    its own non-recursive body, and not outside the WITH that defines it.
+    """
+    refs: set[int] = set()
+    for scope in traverse_scope(tree):
+        for table in scope.tables:
+            if not table.args.get("db") and table.name in scope.cte_sources:
+                refs.add(id(table))
+    return refs
+
+
+def _validate_sql_impl(raw_sql: str) -> str:
+    """
+    Validate and sanitise *raw_sql* (uncached; see validate_sql()).
 
     Returns
     -------
@@ -54,47 +132,99 @@ def validate_sql(raw_sql: str) -> str:
 
     # ---- strip wrapping markdown code-fences the LLM sometimes adds ----
     # e.g.  ```sql\nSELECT …\n```
-    sql = re.sub(r"^```(?:sql)?\s*\n?", "", sql, flags=re.IGNORECASE)
-    sql = re.sub(r"\n?```\s*$", "", sql)
-    sql = sql.strip()
+    sql = _CODE_FENCE.sub("", sql).strip()
 
     # ---- strip trailing semicolons (asyncpg does not like them) ----
     sql = sql.rstrip(";").strip()
 
-    # ---- blocked top-level command? ----
-    if _BLOCKED_STATEMENTS.match(sql):
+    try:
+        statements = [s for s in sqlglot.parse(sql, read="postgres") if s is not None]
+    except SqlglotError as exc:
+        raise ValueError(f"Could not parse SQL query: {exc}") from exc
+
+    if len(statements) != 1:
+        raise ValueError("Exactly one SELECT statement is allowed per query.")
+    tree = statements[0]
+
+    # ---- blocked statement anywhere in the tree (incl. inside CTEs)? ----
+    if isinstance(tree, _BLOCKED_NODES) or next(tree.find_all(*_BLOCKED_NODES), None):
         raise ValueError(
             "Only SELECT queries are allowed. "
             "Destructive statements (DROP, INSERT, UPDATE, DELETE, …) are blocked."
         )
 
-    # ---- must start with SELECT or WITH … SELECT ----
-    if not _ALLOWED_START.match(sql):
+    # ---- must be SELECT, WITH … SELECT, or a UNION / INTERSECT / EXCEPT ----
+    if not isinstance(tree, (exp.Select, exp.SetOperation)):
         raise ValueError(
             "Query must be a SELECT statement (or a CTE starting with WITH … SELECT)."
         )
 
-    # ---- blocked tokens / functions anywhere? ----
-    if _BLOCKED_TOKENS.search(sql):
-        raise ValueError(
-            "Query contains a blocked keyword or function. "
-            "Only standard SELECT queries against ClearQuote tables are permitted."
-        )
-
-    # ---- only allow known table names ----
-    _ALLOWED_TABLES = {"vehicle_cards", "damage_detections", "repairs", "quotes"}
-    # quick heuristic: FROM / JOIN clauses
-    tables_in_query = set(
-        t.lower().strip()
-        for t in re.findall(
-            r"(?:FROM|JOIN)\s+(\w+)", sql, re.IGNORECASE
-        )
-    )
-    unknown = tables_in_query - _ALLOWED_TABLES
+    # ---- functions: blocklist, then allowlist for unmodelled ones ----
+    for func in tree.find_all(exp.Func):
+        name = _function_name(func)
+        if name in _BLOCKED_FUNCTIONS or (
+            isinstance(func, exp.Anonymous) and name not in _ALLOWED_ANONYMOUS_FUNCTIONS
+        ):
+            raise ValueError(_BLOCKED_FUNCTION_MSG)
+
+    # ---- only allow known tables; CTE names count only where in scope ----
+    # Unquoted identifiers fold to lower case, as Postgres resolves them
+    tree = normalize_identifiers(tree, dialect="postgres")
+    try:
+        cte_refs = _cte_references(tree)
+    except SqlglotError as exc:
+        raise ValueError(f"Could not analyse SQL query: {exc}") from exc
+
+    unknown = set()
+    for table in tree.find_all(exp.Table):
+        if id(table) in cte_refs:
+            continue
+        if not isinstance(table.this, exp.Identifier):
+            # Function in FROM position (e.g. generate_series(...))
+            if not isinstance(table.this, _ALLOWED_TABLE_FUNCTIONS):
+                raise ValueError(_BLOCKED_FUNCTION_MSG)
+            continue
+        if table.catalog or table.db not in _ALLOWED_SCHEMAS:
+            raise ValueError(_BLOCKED_FUNCTION_MSG)
+        if table.name not in _ALLOWED_TABLES:
+            unknown.add(table.name)
     if unknown:
         raise ValueError(
             f"Query references unknown table(s): {unknown}. "
-            f"Allowed tables: {_ALLOWED_TABLES}"
+            f"Allowed tables: {set(_ALLOWED_TABLES)}"
         )
 
     return sql
+
+
+@lru_cache(maxsize=2048)
+def _validate_cached(raw_sql: str) -> tuple[bool, str]:
+    """
+    Memoized (ok, cleaned_sql_or_error_message) for *raw_sql*.
+    lru_cache does not remember exceptions, so rejections are stored as
+    values too – a retried bad query is refused without re-parsing.
+    """
+    try:
+        return True, _validate_sql_impl(raw_sql)
+    except ValueError as exc:
+        return False, str(exc)
+
+
+def validate_sql(raw_sql: str) -> str:
+    """
+    Validate and sanitise *raw_sql*.
+    Results are cached on the raw string, since the LLM often re-issues the
+    exact same SQL.
+
+    Returns
+    -------
+    str – the cleaned query ready for execution.
+
+    Raises
+    ------
+    ValueError – if the query fails any safety check.
+    """
+    ok, result = _validate_cached(raw_sql)
+    if not ok:
+        raise ValueError(result)
+    return result
@@ -0,0 +1,38 @@
+"""
+Tests for the CSV readers in scripts/seed_dataset.py.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import seed_dataset  # noqa: E402
+from database import VehicleCard  # noqa: E402
+
+_SPEC = next(s for s in seed_dataset.SEEDS if s.model is VehicleCard)
+
+
+def _csv_path_records(path: Path) -> tuple[list[str], list[tuple]]:
+    rows_iter = seed_dataset._read_rows(path)
+    coercers = seed_dataset._build_coercer(VehicleCard, next(rows_iter))
+    records = [seed_dataset._coerce_row_for_model(r, coercers, _SPEC.table_name) for r in rows_iter]
+    return [key for _, key, _ in coercers], records
+
+
+def test_arrow_reader_matches_csv_reader_with_padded_header(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "vehicle_cards.csv"
+    path.write_text(
+        " card_id , vehicle_type,manufacturer ,manufacture_year,unknown\n"
+        "1, sedan ,Toyota,2019,x\n"
+        "2,,Honda,,y\n",
+        encoding="utf-8",
+    )
+
+    arrow = seed_dataset._read_csv_records_arrow(path, VehicleCard)
+    assert arrow is not None
+    names, records = arrow
+    assert (names, list(records)) == _csv_path_records(path)
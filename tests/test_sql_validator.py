@@ -0,0 +1,71 @@
+"""
+Tests for sql_validator.validate_sql.
+"""
+
+import pytest
+
+from sql_validator import validate_sql
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT repair_id FROM repairs",
+        "```sql\nSELECT repair_id FROM repairs;\n```",
+        "SELECT 'pg_sleep(5)' AS note FROM repairs",
+        "SELECT EXTRACT(YEAR FROM created_at) AS yr FROM quotes",
+        "SELECT card_id FROM repairs UNION SELECT card_id FROM quotes",
+        "WITH x AS (SELECT card_id FROM repairs) SELECT * FROM x",
+        "WITH x AS (SELECT card_id FROM repairs), y AS (SELECT * FROM x) "
+        "SELECT * FROM y JOIN x USING (card_id)",
+        "WITH X AS (SELECT card_id FROM repairs) SELECT * FROM x",
+        "WITH RECURSIVE r(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM r WHERE n < 3) "
+        "SELECT * FROM r",
+        "SELECT d FROM generate_series(1, 3) AS d",
+        "SELECT AGE(NOW(), created_at) FROM vehicle_cards",
+        "SELECT row_to_json(r) FROM repairs r",
+        "SELECT timezone('UTC', created_at) FROM quotes",
+        "SELECT quote_literal(panel_name) FROM repairs",
+        "SELECT gcd(card_id, 6) FROM repairs",
+        "SELECT octet_length(panel_name) FROM repairs",
+        "SELECT num_nonnulls(repair_cost, panel_name) FROM repairs",
+        "SELECT w FROM regexp_split_to_table('front rear', ' ') AS w",
+        "SELECT e.key FROM repairs r, jsonb_each(to_jsonb(r)) AS e",
+        "SELECT COUNT(*) AS matching_repairs, AVG(r.repair_cost) AS avg_repair_cost "
+        "FROM damage_detections d JOIN repairs r "
+        "ON r.card_id = d.card_id AND r.panel_name = d.panel_name "
+        "WHERE d.detected_at >= NOW() - INTERVAL '30 days'",
+    ],
+)
+def test_accepts_safe_selects(sql):
+    assert validate_sql(sql)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "",
+        "DROP TABLE repairs",
+        "DELETE FROM repairs",
+        "SELECT 1; DROP TABLE repairs",
+        "WITH d AS (DELETE FROM repairs RETURNING *) SELECT * FROM d",
+        "SELECT * INTO repairs_copy FROM repairs",
+        "SELECT pg_sleep(5)",
+        "SELECT * FROM users",
+        "SELECT * FROM information_schema.tables",
+        # a non-recursive CTE's body sees the real relation, not itself
+        "WITH pg_stat_activity AS (SELECT * FROM pg_stat_activity) "
+        "SELECT * FROM pg_stat_activity",
+        # a CTE name is not visible outside the WITH that defines it
+        "SELECT * FROM (WITH pg_authid AS (SELECT 1) SELECT 1) a CROSS JOIN pg_authid",
+        # set-returning system functions in FROM
+        "SELECT * FROM pg_ls_waldir()",
+        # system schemas reached through function arguments
+        "SELECT schema_to_xml('pg_catalog', true, true, '')",
+        "SELECT table_to_xml('pg_catalog.pg_authid', true, true, '')",
+        "SELECT current_setting('data_directory')",
+    ],
+)
+def test_rejects_unsafe_queries(sql):
+    with pytest.raises(ValueError):
+        validate_sql(sql)